@@ -13,7 +13,7 @@ TILE_SIZE = 20
 GRID_WIDTH = 40   # Number of tiles horizontally
 GRID_HEIGHT = 30  # Number of tiles vertically
 
-# Grid states
+# Grid states (stored as bytes in Grid.cells, so values must fit in 0-255)
 EMPTY = 0
 TOWER = 1
 WALL = 2
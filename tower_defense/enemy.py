@@ -9,9 +9,15 @@ try:
 except ImportError:
     PYGAME_AVAILABLE = False
 
-import math
-from typing import List, Tuple, Optional
-from config import BASE_ENEMY_HEALTH, BASE_ENEMY_SPEED, TILE_SIZE
+from math import sqrt
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
+from utils import make_surface
+from config import (
+    BASE_ENEMY_HEALTH, BASE_ENEMY_SPEED, TILE_SIZE,
+    WAVE_HEALTH_MULTIPLIER, WAVE_SPEED_MULTIPLIER
+)
 
 
 class EnemyType:
@@ -21,12 +27,133 @@ class EnemyType:
     TANK = "tank"
 
 
+# Base stats by type: (health, speed, reward, color, name)
+_ENEMY_STATS: Dict[str, Tuple[float, float, int, Tuple[int, int, int], str]] = {
+    EnemyType.BASIC: (BASE_ENEMY_HEALTH, BASE_ENEMY_SPEED, 25, (200, 80, 80), "Basic Enemy"),  # Red
+    EnemyType.FAST: (BASE_ENEMY_HEALTH * 0.6, BASE_ENEMY_SPEED * 1.5, 30, (80, 200, 80), "Fast Enemy"),  # Green
+    EnemyType.TANK: (BASE_ENEMY_HEALTH * 3, BASE_ENEMY_SPEED * 0.7, 50, (80, 80, 200), "Tank Enemy"),  # Blue
+}
+
+
+# Health bar geometry and colors
+_HEALTH_BAR_WIDTH = 20
+_HEALTH_BAR_HALF_WIDTH = _HEALTH_BAR_WIDTH // 2
+_HEALTH_BAR_HEIGHT = 3
+_HEALTH_BAR_BG = (100, 0, 0)  # Red
+_HEALTH_BAR_FG = (0, 200, 0)  # Green
+_HEALTH_BAR_BORDER = (255, 255, 255)
+
+
+# Pre-rendered sprites, keyed by (color, radius) for bodies and radius for slow glows
+_BODY_SPRITES = {}
+_SLOW_GLOW_SPRITES = {}
+_HEALTH_BAR_SPRITES = {}  # keyed by filled width in pixels
+
+
+def _get_body_sprite(color: Tuple[int, int, int], radius: int):
+    """Get the cached enemy body sprite (filled circle with white outline)."""
+    sprite = _BODY_SPRITES.get((color, radius))
+    if sprite is None:
+        sprite = make_surface((radius * 2, radius * 2), alpha=True)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        pygame.draw.circle(sprite, (255, 255, 255), (radius, radius), radius, 1)
+        _BODY_SPRITES[(color, radius)] = sprite
+    return sprite
+
+
+def _get_slow_glow_sprite(radius: int):
+    """Get the cached blue glow sprite drawn over slowed enemies."""
+    sprite = _SLOW_GLOW_SPRITES.get(radius)
+    if sprite is None:
+        sprite = make_surface((radius * 4, radius * 4), alpha=True)
+        pygame.draw.circle(sprite, (100, 150, 255, 80), (radius * 2, radius * 2), radius * 2)
+        _SLOW_GLOW_SPRITES[radius] = sprite
+    return sprite
+
+
+def _get_health_bar_sprite(health_width: int):
+    """Get the cached health bar sprite with the given filled width."""
+    sprite = _HEALTH_BAR_SPRITES.get(health_width)
+    if sprite is None:
+        sprite = make_surface((_HEALTH_BAR_WIDTH, _HEALTH_BAR_HEIGHT))
+        sprite.fill(_HEALTH_BAR_BG)
+        if health_width > 0:
+            sprite.fill(_HEALTH_BAR_FG, (0, 0, health_width, _HEALTH_BAR_HEIGHT))
+        pygame.draw.rect(sprite, _HEALTH_BAR_BORDER, sprite.get_rect(), 1)
+        _HEALTH_BAR_SPRITES[health_width] = sprite
+    return sprite
+
+
+@lru_cache(maxsize=None)
+def _wave_multipliers(wave_number: int) -> Tuple[float, float]:
+    """Get the (health, speed) scaling factors for a wave."""
+    return (WAVE_HEALTH_MULTIPLIER ** (wave_number - 1),
+            WAVE_SPEED_MULTIPLIER ** (wave_number - 1))
+
+
+@lru_cache(maxsize=None)
+def _wave_plan(wave_number: int) -> Tuple[str, ...]:
+    """
+    Get the enemy composition for a wave (deterministic, so built once per wave).
+
+    Args:
+        wave_number: Wave number
+
+    Returns:
+        Enemy types to spawn, in spawn order
+    """
+    enemies = []
+
+    # Wave 1-3: Only basic enemies
+    if wave_number <= 3:
+        count = 5 + wave_number * 3
+        enemies = [EnemyType.BASIC] * count
+
+    # Wave 4-6: Mix of basic and fast
+    elif wave_number <= 6:
+        basic_count = 5 + wave_number * 2
+        fast_count = wave_number - 3
+        enemies = [EnemyType.BASIC] * basic_count + [EnemyType.FAST] * fast_count
+
+    # Wave 7+: All types
+    else:
+        basic_count = 8 + wave_number
+        fast_count = wave_number // 2
+        tank_count = (wave_number - 6) // 2
+        enemies = ([EnemyType.BASIC] * basic_count +
+                  [EnemyType.FAST] * fast_count +
+                  [EnemyType.TANK] * tank_count)
+
+    return tuple(enemies)
+
+
+def path_to_world(path: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Convert a grid path to world coordinates (pixel center of each tile).
+
+    Args:
+        path: List of (x, y) grid positions
+
+    Returns:
+        List of (x, y) world positions
+    """
+    half_tile = TILE_SIZE // 2
+    return [(x * TILE_SIZE + half_tile, y * TILE_SIZE + half_tile) for x, y in path]
+
+
 class Enemy:
     """
     Base enemy class that follows paths and can be damaged.
     """
 
-    def __init__(self, path: List[Tuple[int, int]], enemy_type: str = EnemyType.BASIC, wave_number: int = 1):
+    __slots__ = (
+        'enemy_type', 'wave_number', 'base_health', 'base_speed', 'reward', 'color', 'name',
+        'path', 'world_path', 'path_index', 'x', 'y', 'radius',
+        'max_health', 'health', 'alive', 'slow_multiplier', 'slow_duration', 'reached_end'
+    )
+
+    def __init__(self, path: List[Tuple[int, int]], enemy_type: str = EnemyType.BASIC, wave_number: int = 1,
+                 world_path: Optional[List[Tuple[int, int]]] = None):
         # Type and stats
         self.enemy_type = enemy_type
         self.wave_number = wave_number
@@ -34,16 +161,16 @@ class Enemy:
 
         # Position and movement
         self.path = path  # List of (x, y) grid positions
+        # Same waypoints as tile centers in pixels (shared with the spawner when given)
+        self.world_path = world_path if world_path is not None else path_to_world(path)
         self.path_index = 0
         self.x = 0.0  # World position (pixels)
         self.y = 0.0
         self.radius = 6  # Collision radius
 
         # Set initial position at start of path
-        if path:
-            start_x, start_y = path[0]
-            self.x = start_x * TILE_SIZE + TILE_SIZE // 2
-            self.y = start_y * TILE_SIZE + TILE_SIZE // 2
+        if self.world_path:
+            self.x, self.y = self.world_path[0]
 
         # Health
         self.max_health = self.base_health
@@ -59,32 +186,12 @@ class Enemy:
 
     def _initialize_stats(self):
         """Initialize enemy stats based on type and wave."""
-        # Base stats by type
-        if self.enemy_type == EnemyType.BASIC:
-            self.base_health = BASE_ENEMY_HEALTH
-            self.base_speed = BASE_ENEMY_SPEED
-            self.reward = 25
-            self.color = (200, 80, 80)  # Red
-            self.name = "Basic Enemy"
-
-        elif self.enemy_type == EnemyType.FAST:
-            self.base_health = BASE_ENEMY_HEALTH * 0.6  # Less health
-            self.base_speed = BASE_ENEMY_SPEED * 1.5  # Faster
-            self.reward = 30
-            self.color = (80, 200, 80)  # Green
-            self.name = "Fast Enemy"
-
-        elif self.enemy_type == EnemyType.TANK:
-            self.base_health = BASE_ENEMY_HEALTH * 3  # Much more health
-            self.base_speed = BASE_ENEMY_SPEED * 0.7  # Slower
-            self.reward = 50
-            self.color = (80, 80, 200)  # Blue
-            self.name = "Tank Enemy"
+        base_health, base_speed, self.reward, self.color, self.name = _ENEMY_STATS[self.enemy_type]
 
         # Scale with wave number
-        from config import WAVE_HEALTH_MULTIPLIER, WAVE_SPEED_MULTIPLIER
-        self.base_health *= (WAVE_HEALTH_MULTIPLIER ** (self.wave_number - 1))
-        self.base_speed *= (WAVE_SPEED_MULTIPLIER ** (self.wave_number - 1))
+        health_multiplier, speed_multiplier = _wave_multipliers(self.wave_number)
+        self.base_health = base_health * health_multiplier
+        self.base_speed = base_speed * speed_multiplier
 
     def update(self, dt: float = 1.0):
         """
@@ -108,32 +215,37 @@ class Enemy:
 
     def _move_along_path(self, dt: float):
         """Move enemy toward next waypoint in path."""
-        if self.path_index >= len(self.path):
+        # Bind per-frame state to locals; attributes are written back once
+        world_path = self.world_path
+        path_index = self.path_index
+        path_length = len(world_path)
+
+        if path_index >= path_length:
             self.reached_end = True
             return
 
-        # Get target waypoint (convert grid to world coordinates)
-        target_grid_x, target_grid_y = self.path[self.path_index]
-        target_x = target_grid_x * TILE_SIZE + TILE_SIZE // 2
-        target_y = target_grid_y * TILE_SIZE + TILE_SIZE // 2
+        # Get target waypoint (already in world coordinates)
+        target_x, target_y = world_path[path_index]
 
         # Calculate direction
-        dx = target_x - self.x
-        dy = target_y - self.y
-        distance = math.sqrt(dx * dx + dy * dy)
-
-        # Check if reached waypoint
-        if distance < 2:
-            self.path_index += 1
-            if self.path_index >= len(self.path):
+        x = self.x
+        y = self.y
+        dx = target_x - x
+        dy = target_y - y
+        dist_sq = dx * dx + dy * dy
+
+        # Check if reached waypoint (within 2px, compared squared to skip the sqrt)
+        if dist_sq < 4:
+            path_index += 1
+            self.path_index = path_index
+            if path_index >= path_length:
                 self.reached_end = True
             return
 
-        # Move toward waypoint
-        effective_speed = self.base_speed * self.slow_multiplier * dt
-        if distance > 0:
-            self.x += (dx / distance) * effective_speed
-            self.y += (dy / distance) * effective_speed
+        # Move toward waypoint: scale the offset by speed / distance in one step
+        step = self.base_speed * self.slow_multiplier * dt / sqrt(dist_sq)
+        self.x = x + dx * step
+        self.y = y + dy * step
 
     def take_damage(self, damage: int):
         """
@@ -180,49 +292,33 @@ class Enemy:
         if not PYGAME_AVAILABLE or not self.alive:
             return
 
-        # Draw enemy circle
-        pygame.draw.circle(surface, self.color,
-                          (int(self.x), int(self.y)), self.radius)
-
-        # Draw outline
-        pygame.draw.circle(surface, (255, 255, 255),
-                          (int(self.x), int(self.y)), self.radius, 1)
+        # Draw enemy circle with outline
+        x, y, radius = int(self.x), int(self.y), self.radius
+        surface.blit(_get_body_sprite(self.color, radius), (x - radius, y - radius))
 
         # Draw health bar
         self._draw_health_bar(surface)
 
-        # Draw slow effect indicator
+        # Draw slow effect indicator (blue glow for slowed enemies)
         if self.slow_duration > 0:
-            # Blue glow for slowed enemies
-            glow_surface = pygame.Surface((self.radius * 4, self.radius * 4), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (100, 150, 255, 80),
-                             (self.radius * 2, self.radius * 2), self.radius * 2)
-            surface.blit(glow_surface, (int(self.x) - self.radius * 2,
-                                       int(self.y) - self.radius * 2))
+            surface.blit(_get_slow_glow_sprite(radius), (x - radius * 2, y - radius * 2))
 
     def _draw_health_bar(self, surface):
         """Draw health bar above enemy."""
         if not PYGAME_AVAILABLE:
             return
 
-        bar_width = 20
-        bar_height = 3
-        bar_x = int(self.x - bar_width // 2)
-        bar_y = int(self.y - self.radius - 8)
-
-        # Background (red)
-        pygame.draw.rect(surface, (100, 0, 0),
-                        (bar_x, bar_y, bar_width, bar_height))
+        surface.blit(*self._health_bar_blit())
 
-        # Health (green)
-        health_width = int(bar_width * self.get_health_percentage())
-        if health_width > 0:
-            pygame.draw.rect(surface, (0, 200, 0),
-                            (bar_x, bar_y, health_width, bar_height))
+    def _health_bar_blit(self) -> tuple:
+        """Get the (sprite, position) pair for this enemy's health bar."""
+        bar_x = int(self.x - _HEALTH_BAR_HALF_WIDTH)
+        bar_y = int(self.y - self.radius - 8)
 
-        # Border
-        pygame.draw.rect(surface, (255, 255, 255),
-                        (bar_x, bar_y, bar_width, bar_height), 1)
+        # Red background, green fill for remaining health, white border
+        health_width = int(_HEALTH_BAR_WIDTH * self.get_health_percentage())
+        health_width = min(max(health_width, 0), _HEALTH_BAR_WIDTH)
+        return _get_health_bar_sprite(health_width), (bar_x, bar_y)
 
     def get_reward(self) -> int:
         """Get money reward for killing this enemy."""
@@ -234,14 +330,30 @@ class EnemySpawner:
     Manages enemy spawning and waves.
     """
 
+    __slots__ = (
+        '_path', 'world_path', 'wave_number', 'enemies_to_spawn',
+        'spawn_timer', 'spawn_interval', 'wave_active'
+    )
+
     def __init__(self, path: List[Tuple[int, int]]):
-        self.path = path
+        self.path = path  # Also computes world_path, shared by every spawned enemy
         self.wave_number = 0
-        self.enemies_to_spawn = []  # Queue of enemies to spawn
+        self.enemies_to_spawn = deque()  # Queue of enemy types to spawn
         self.spawn_timer = 0
         self.spawn_interval = 30  # Ticks between spawns (0.5 seconds at 60 FPS)
         self.wave_active = False
 
+    @property
+    def path(self) -> List[Tuple[int, int]]:
+        """Grid path that spawned enemies follow."""
+        return self._path
+
+    @path.setter
+    def path(self, path: List[Tuple[int, int]]):
+        """Set the spawn path and convert it to world coordinates once for all enemies."""
+        self._path = path
+        self.world_path = path_to_world(path)
+
     def start_wave(self, wave_number: int):
         """
         Start a new wave of enemies.
@@ -251,43 +363,9 @@ class EnemySpawner:
         """
         self.wave_number = wave_number
         self.wave_active = True
-        self.enemies_to_spawn = self._generate_wave(wave_number)
+        self.enemies_to_spawn = deque(_wave_plan(wave_number))
         self.spawn_timer = 0
 
-    def _generate_wave(self, wave_number: int) -> List[str]:
-        """
-        Generate enemy composition for a wave.
-
-        Args:
-            wave_number: Wave number
-
-        Returns:
-            List of enemy types to spawn
-        """
-        enemies = []
-
-        # Wave 1-3: Only basic enemies
-        if wave_number <= 3:
-            count = 5 + wave_number * 3
-            enemies = [EnemyType.BASIC] * count
-
-        # Wave 4-6: Mix of basic and fast
-        elif wave_number <= 6:
-            basic_count = 5 + wave_number * 2
-            fast_count = wave_number - 3
-            enemies = [EnemyType.BASIC] * basic_count + [EnemyType.FAST] * fast_count
-
-        # Wave 7+: All types
-        else:
-            basic_count = 8 + wave_number
-            fast_count = wave_number // 2
-            tank_count = (wave_number - 6) // 2
-            enemies = ([EnemyType.BASIC] * basic_count +
-                      [EnemyType.FAST] * fast_count +
-                      [EnemyType.TANK] * tank_count)
-
-        return enemies
-
     def update(self, dt: float = 1.0) -> Optional[Enemy]:
         """
         Update spawner and return next enemy if ready.
@@ -298,22 +376,27 @@ class EnemySpawner:
         Returns:
             Enemy object if one should spawn, None otherwise
         """
-        if not self.wave_active or not self.enemies_to_spawn:
+        if not self.wave_active:
             return None
 
-        self.spawn_timer += dt
+        queue = self.enemies_to_spawn
+        if not queue:
+            return None
 
-        if self.spawn_timer >= self.spawn_interval:
-            self.spawn_timer = 0
-            enemy_type = self.enemies_to_spawn.pop(0)
+        # Most ticks only advance the timer
+        spawn_timer = self.spawn_timer + dt
+        if spawn_timer < self.spawn_interval:
+            self.spawn_timer = spawn_timer
+            return None
 
-            # Check if wave complete
-            if not self.enemies_to_spawn:
-                self.wave_active = False
+        self.spawn_timer = 0
+        enemy_type = queue.popleft()
 
-            return Enemy(self.path, enemy_type, self.wave_number)
+        # Check if wave complete
+        if not queue:
+            self.wave_active = False
 
-        return None
+        return Enemy(self._path, enemy_type, self.wave_number, self.world_path)
 
     def is_wave_complete(self) -> bool:
         """Check if current wave spawning is complete."""
@@ -324,6 +407,34 @@ class EnemySpawner:
         return len(self.enemies_to_spawn)
 
 
+def draw_enemies(surface, enemies: List[Enemy]):
+    """
+    Draw all living enemies, batching each layer's sprite blits into a single call.
+
+    Args:
+        surface: Pygame surface to draw on
+        enemies: List of enemies to draw
+    """
+    if not PYGAME_AVAILABLE:
+        return
+
+    bodies = []
+    health_bars = []
+    glows = []
+    for enemy in enemies:
+        if not enemy.alive:
+            continue
+        health_bars.append(enemy._health_bar_blit())
+        x, y, radius = int(enemy.x), int(enemy.y), enemy.radius
+        bodies.append((_get_body_sprite(enemy.color, radius), (x - radius, y - radius)))
+        if enemy.slow_duration > 0:
+            glows.append((_get_slow_glow_sprite(radius), (x - radius * 2, y - radius * 2)))
+
+    surface.blits(bodies, doreturn=False)
+    surface.blits(health_bars, doreturn=False)
+    surface.blits(glows, doreturn=False)
+
+
 def create_enemy(path: List[Tuple[int, int]], enemy_type: str = EnemyType.BASIC,
                 wave_number: int = 1) -> Enemy:
     """
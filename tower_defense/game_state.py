@@ -11,6 +11,13 @@ class GameState:
     Manages the overall game state including resources, score, and waves.
     """
 
+    __slots__ = (
+        'money', 'lives', 'score', 'kills',
+        'current_wave', 'wave_active', 'enemies_in_wave', 'enemies_spawned',
+        'game_over', 'game_won', 'paused',
+        '_ui_key', '_ui_info'
+    )
+
     def __init__(self):
         # Resources
         self.money = STARTING_MONEY
@@ -31,6 +38,10 @@ class GameState:
         self.game_won = False
         self.paused = False
 
+        # Cached UI strings and the values they were formatted from
+        self._ui_key = None
+        self._ui_info = {}
+
     def can_afford(self, cost: int) -> bool:
         """Check if player has enough money."""
         return self.money >= cost
@@ -139,11 +150,20 @@ class GameState:
         }
 
     def get_ui_info(self) -> dict:
-        """Get information for UI display."""
-        return {
-            'money': f"${self.money}",
-            'lives': f"Lives: {self.lives}",
-            'wave': f"Wave: {self.current_wave}",
-            'kills': f"Kills: {self.kills}",
-            'score': f"Score: {self.score}"
-        }
+        """
+        Get information for UI display.
+
+        The strings are only reformatted when one of the displayed values
+        changes, so the returned dict is shared and should not be modified.
+        """
+        key = (self.money, self.lives, self.current_wave, self.kills, self.score)
+        if key != self._ui_key:
+            self._ui_key = key
+            self._ui_info = {
+                'money': f"${self.money}",
+                'lives': f"Lives: {self.lives}",
+                'wave': f"Wave: {self.current_wave}",
+                'kills': f"Kills: {self.kills}",
+                'score': f"Score: {self.score}"
+            }
+        return self._ui_info
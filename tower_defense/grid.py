@@ -3,6 +3,7 @@ Tower Defense Game - Grid System
 Handles the game grid, rendering, and cell states.
 """
 
+import math
 import pygame
 from typing import Optional, List
 from config import (
@@ -11,7 +12,8 @@ from config import (
     COLORS, CELL_COLORS, DEFAULT_START, DEFAULT_END
 )
 from pathfinding import Pathfinder
-from tower import Tower, create_tower
+from utils import make_surface
+from tower import Tower, TowerType, create_tower
 
 
 class Grid:
@@ -24,30 +26,79 @@ class Grid:
         self.height = GRID_HEIGHT
         self.tile_size = TILE_SIZE
 
-        # Initialize grid with empty cells
-        self.cells = [[EMPTY for _ in range(self.height)] for _ in range(self.width)]
+        # Initialize grid with empty cells: a flat buffer, 1 byte per cell,
+        # laid out column by column so (x, y) lives at x * height + y
+        self.cells = bytearray([EMPTY]) * (self.width * self.height)
 
         # Set start and end points
         self.start_pos = DEFAULT_START
         self.end_pos = DEFAULT_END
-        self.cells[self.start_pos[0]][self.start_pos[1]] = START
-        self.cells[self.end_pos[0]][self.end_pos[1]] = END
+        self.cells[self.start_pos[0] * self.height + self.start_pos[1]] = START
+        self.cells[self.end_pos[0] * self.height + self.end_pos[1]] = END
+
+        # Pre-rendered cell colors and grid lines, rebuilt only when cells change
+        pixel_size = (self.width * TILE_SIZE, self.height * TILE_SIZE)
+        self._bg_surface = make_surface(pixel_size)
+        self._bg_dirty = True
+
+        # One shared tile per cell state, with the grid-line border baked in,
+        # in a lookup table indexed by cell byte (unknown states draw as empty)
+        tiles = {}
+        for state, color in CELL_COLORS.items():
+            tile = make_surface((TILE_SIZE, TILE_SIZE))
+            tile.fill(color)
+            pygame.draw.rect(tile, COLORS['grid_line'], tile.get_rect(), 1)
+            tiles[state] = tile
+        self._cell_tiles = [tiles.get(state, tiles[EMPTY]) for state in range(256)]
+
+        # Pre-filled hover overlays (with alpha) and border colors, indexed by placement validity
+        hover_valid = make_surface((TILE_SIZE, TILE_SIZE), alpha=True)
+        hover_valid.fill(COLORS['hover_valid'])
+        hover_invalid = make_surface((TILE_SIZE, TILE_SIZE), alpha=True)
+        hover_invalid.fill(COLORS['hover_invalid'])
+        self._hover_styles = (
+            (hover_invalid, (255, 100, 100)),  # False
+            (hover_valid, (255, 255, 255)),    # True
+        )
+        self._hover_validity = None  # (position, is valid) from the last hover check
+        self._block_checks = {}  # position -> would_block_path result for the current cells
 
-        # Create surface for hover overlay (with alpha)
-        self.hover_surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+        # Semi-transparent highlight for cells on the path
+        self._path_tile = make_surface((TILE_SIZE, TILE_SIZE), alpha=True)
+        self._path_tile.fill((*COLORS['path'], 40))
 
         # Pathfinding system
         self.pathfinder = Pathfinder(self.width, self.height)
         self.current_path = []
+        self._path_set = set()  # Cells on current_path, for quick membership checks
+        self._path_cell_blits = []  # (tile, position) pairs highlighting current_path
+        self._path_points = []  # Cell centers along current_path, for the path line
         self._update_path()
 
         # Tower system
         self.towers = {}  # Dictionary mapping (x, y) -> Tower object
+        self._tower_coverage = {}  # (x, y) -> towers whose range reaches that cell
+        self._active_towers = {}  # (x, y) -> Tower, excluding walls (they never act)
     
+    def reset(self):
+        """Clear all towers and obstacles, keeping start/end and cached surfaces."""
+        self.cells[:] = bytearray([EMPTY]) * len(self.cells)
+        self.cells[self.start_pos[0] * self.height + self.start_pos[1]] = START
+        self.cells[self.end_pos[0] * self.height + self.end_pos[1]] = END
+        self.towers.clear()
+        self._tower_coverage.clear()
+        self._active_towers.clear()
+        self._cells_changed()
+        self._update_path()
+
+    def in_bounds(self, grid_x: int, grid_y: int) -> bool:
+        """Check if grid coordinates lie inside the grid."""
+        return 0 <= grid_x < self.width and 0 <= grid_y < self.height
+
     def get_cell(self, grid_x: int, grid_y: int) -> int:
         """Get the state of a cell at grid coordinates."""
-        if 0 <= grid_x < self.width and 0 <= grid_y < self.height:
-            return self.cells[grid_x][grid_y]
+        if self.in_bounds(grid_x, grid_y):
+            return self.cells[grid_x * self.height + grid_y]
         return -1  # Invalid position
     
     def set_cell(self, grid_x: int, grid_y: int, state: int) -> bool:
@@ -55,15 +106,20 @@ class Grid:
         Set the state of a cell. Returns True if successful.
         Prevents modifying start/end points.
         """
-        if not (0 <= grid_x < self.width and 0 <= grid_y < self.height):
+        if not self.in_bounds(grid_x, grid_y):
             return False
 
         # Don't allow modifying start or end points
         if (grid_x, grid_y) == self.start_pos or (grid_x, grid_y) == self.end_pos:
             return False
 
-        self.cells[grid_x][grid_y] = state
-        self._update_path()  # Recalculate path when grid changes
+        self.cells[grid_x * self.height + grid_y] = state
+        self._cells_changed()
+
+        # Blocking a cell off the current path leaves that path valid and still
+        # shortest, so only other changes need the path recalculated
+        if state not in (TOWER, WALL) or not self._is_off_path(grid_x, grid_y):
+            self._update_path()
         return True
     
     def place_tower(self, grid_x: int, grid_y: int, tower_type: str, game_state) -> bool:
@@ -78,8 +134,8 @@ class Grid:
         Returns:
             True if tower was placed, False otherwise
         """
-        # Check if position is valid
-        if not self.is_valid_placement(grid_x, grid_y):
+        # Check if position is free (path blocking is checked when the cell is set)
+        if not self.in_bounds(grid_x, grid_y) or self.cells[grid_x * self.height + grid_y] != EMPTY:
             return False
 
         # Check if can afford
@@ -87,8 +143,8 @@ class Grid:
         if not game_state.can_afford(tower_cost):
             return False
 
-        # Check if placing would block path
-        if self.would_block_path(grid_x, grid_y):
+        # Mark the cell, backing out if placing would block path
+        if not self._block_cell(grid_x, grid_y, TOWER):
             return False
 
         # Create and place tower
@@ -101,7 +157,10 @@ class Grid:
 
         # Add to grid
         self.towers[(grid_x, grid_y)] = tower
-        self.set_cell(grid_x, grid_y, TOWER)
+        if tower_type != TowerType.WALL:
+            self._active_towers[(grid_x, grid_y)] = tower
+        for cell in self._range_cells(tower):
+            self._tower_coverage.setdefault(cell, []).append(tower)
 
         # Spend money
         game_state.spend_money(tower_cost)
@@ -129,6 +188,12 @@ class Grid:
 
         # Remove tower
         del self.towers[(grid_x, grid_y)]
+        self._active_towers.pop((grid_x, grid_y), None)
+        for cell in self._range_cells(tower):
+            covering = self._tower_coverage[cell]
+            covering.remove(tower)
+            if not covering:
+                del self._tower_coverage[cell]
         self.set_cell(grid_x, grid_y, EMPTY)
 
         return True
@@ -143,19 +208,49 @@ class Grid:
 
     def update_towers(self, enemies: list, dt: float = 1.0):
         """Update all towers (targeting, shooting)."""
-        for tower in self.towers.values():
-            tower.update(enemies, dt)
+        # Bucket enemies by cell so each tower only considers enemies its range
+        # can reach, keeping the original enemy order for targeting ties
+        ts = self.tile_size
+        coverage = self._tower_coverage
+        candidates = {}
+        for enemy in enemies:
+            covering = coverage.get((int(enemy.x // ts), int(enemy.y // ts)))
+            if covering:
+                for tower in covering:
+                    candidates.setdefault(tower, []).append(enemy)
+
+        for tower in self._active_towers.values():
+            tower.update(candidates.get(tower, ()), dt)
+
+    def _range_cells(self, tower: Tower) -> List[tuple]:
+        """Get the in-grid cells with any point within the tower's range."""
+        if tower.range <= 0:
+            return []  # Walls don't target anything
+
+        ts = self.tile_size
+        reach = math.ceil(tower.range / ts)
+        range_sq = tower.range_sq
+        cells = []
+        for dx in range(-reach, reach + 1):
+            # Distance from the tower's center to the nearest edge of the cell
+            near_x = max(abs(dx) - 0.5, 0) * ts
+            for dy in range(-reach, reach + 1):
+                near_y = max(abs(dy) - 0.5, 0) * ts
+                cell_x, cell_y = tower.grid_x + dx, tower.grid_y + dy
+                if near_x * near_x + near_y * near_y <= range_sq and self.in_bounds(cell_x, cell_y):
+                    cells.append((cell_x, cell_y))
+        return cells
     
     def is_valid_placement(self, grid_x: int, grid_y: int) -> bool:
         """
         Check if a tower can be placed at the given position.
         Includes check for whether placement would block the path.
         """
-        if not (0 <= grid_x < self.width and 0 <= grid_y < self.height):
+        if not self.in_bounds(grid_x, grid_y):
             return False
 
-        current = self.get_cell(grid_x, grid_y)
-        if current != EMPTY:
+        # Bounds already checked, so read the cell directly
+        if self.cells[grid_x * self.height + grid_y] != EMPTY:
             return False
 
         # Check if placement would block path
@@ -182,24 +277,10 @@ class Grid:
         show_tower_range: Whether to show tower ranges.
         selected_tower_pos: Position of selected tower to show range for.
         """
-        # Draw each cell
-        for x in range(self.width):
-            for y in range(self.height):
-                cell_state = self.cells[x][y]
-                color = CELL_COLORS.get(cell_state, COLORS['empty'])
-
-                rect = pygame.Rect(
-                    x * self.tile_size,
-                    y * self.tile_size,
-                    self.tile_size,
-                    self.tile_size
-                )
-
-                # Fill cell with color
-                pygame.draw.rect(surface, color, rect)
-
-                # Draw grid lines
-                pygame.draw.rect(surface, COLORS['grid_line'], rect, 1)
+        # Draw cells and grid lines from the cached background
+        if self._bg_dirty:
+            self._rebuild_background()
+        surface.blit(self._bg_surface, (0, 0))
 
         # Draw path visualization
         if show_path and self.current_path:
@@ -207,7 +288,7 @@ class Grid:
 
         # Draw tower ranges (if enabled)
         if show_tower_range:
-            for tower in self.towers.values():
+            for tower in self._active_towers.values():
                 tower.draw_range(surface)
 
         # Draw selected tower range
@@ -222,54 +303,52 @@ class Grid:
         # Draw hover highlight
         if hover_pos is not None:
             grid_x, grid_y = hover_pos
-            if 0 <= grid_x < self.width and 0 <= grid_y < self.height:
+            if self.in_bounds(grid_x, grid_y):
                 self._draw_hover(surface, grid_x, grid_y)
     
+    def _rebuild_background(self):
+        """Render every cell and its grid lines onto the cached background surface."""
+        ts = self.tile_size
+        tiles = self._cell_tiles
+        positions = [(x * ts, y * ts) for x in range(self.width) for y in range(self.height)]
+
+        # Blit each cell's pre-bordered tile in a single batch
+        self._bg_surface.blits(
+            [
+                (tiles[cell_state], position)
+                for cell_state, position in zip(self.cells, positions)
+            ],
+            doreturn=False,
+        )
+        self._bg_dirty = False
+
     def _draw_path(self, surface: pygame.Surface):
         """Draw the current path as a line and highlighted cells."""
         if len(self.current_path) < 2:
             return
 
-        # Draw path as highlighted cells (subtle)
-        path_surface = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
-        path_surface.fill((*COLORS['path'], 40))  # Semi-transparent yellow
-
-        for pos in self.current_path:
-            # Skip start and end (they have their own colors)
-            if pos == self.start_pos or pos == self.end_pos:
-                continue
-
-            screen_x, screen_y = self.grid_to_screen(pos[0], pos[1])
-            surface.blit(path_surface, (screen_x, screen_y))
+        # Draw path as highlighted cells (subtle), prepared when the path changed
+        surface.blits(self._path_cell_blits, doreturn=False)
 
         # Draw path as a line connecting cell centers
-        points = []
-        for pos in self.current_path:
-            screen_x, screen_y = self.grid_to_screen(pos[0], pos[1])
-            center_x = screen_x + self.tile_size // 2
-            center_y = screen_y + self.tile_size // 2
-            points.append((center_x, center_y))
-
-        if len(points) >= 2:
-            pygame.draw.lines(surface, COLORS['path'], False, points, 3)
+        pygame.draw.lines(surface, COLORS['path'], False, self._path_points, 3)
 
     def _draw_hover(self, surface: pygame.Surface, grid_x: int, grid_y: int):
         """Draw hover highlight at the given grid position."""
-        # Determine hover color based on whether placement is valid
-        if self.is_valid_placement(grid_x, grid_y):
-            hover_color = COLORS['hover_valid']
-        else:
-            hover_color = COLORS['hover_invalid']
+        # Placement validity may need a path search, so only check it again
+        # when the hovered cell or the grid has changed
+        hover_key = (grid_x, grid_y)
+        if self._hover_validity is None or self._hover_validity[0] != hover_key:
+            self._hover_validity = (hover_key, self.is_valid_placement(grid_x, grid_y))
 
-        # Create semi-transparent hover overlay
-        self.hover_surface.fill(hover_color)
+        # Pick the semi-transparent overlay and border from that single check
+        hover_surface, border_color = self._hover_styles[self._hover_validity[1]]
 
         screen_x, screen_y = self.grid_to_screen(grid_x, grid_y)
-        surface.blit(self.hover_surface, (screen_x, screen_y))
+        surface.blit(hover_surface, (screen_x, screen_y))
 
         # Draw a brighter border
         rect = pygame.Rect(screen_x, screen_y, self.tile_size, self.tile_size)
-        border_color = (255, 255, 255) if self.is_valid_placement(grid_x, grid_y) else (255, 100, 100)
         pygame.draw.rect(surface, border_color, rect, 2)
     
     def draw_debug_info(self, surface: pygame.Surface, font: pygame.font.Font, hover_pos: tuple):
@@ -278,10 +357,10 @@ class Grid:
             return
 
         grid_x, grid_y = hover_pos
-        if not (0 <= grid_x < self.width and 0 <= grid_y < self.height):
+        if not self.in_bounds(grid_x, grid_y):
             return
 
-        cell_state = self.get_cell(grid_x, grid_y)
+        cell_state = self.cells[grid_x * self.height + grid_y]
         state_names = {EMPTY: 'Empty', TOWER: 'Tower', WALL: 'Wall', START: 'Start', END: 'End'}
         state_name = state_names.get(cell_state, 'Unknown')
 
@@ -294,20 +373,75 @@ class Grid:
         path_surface = font.render(path_status, True, COLORS['text'])
         surface.blit(path_surface, (10, 30))
 
-    def _update_path(self):
-        """Update the current path using pathfinding."""
-        self.pathfinder.update_path(self.cells, self.start_pos, self.end_pos, allow_diagonal=False)
+    def _update_path(self) -> bool:
+        """Update the current path using pathfinding. Returns True if a path exists."""
+        found = self.pathfinder.update_path(self.cells, self.start_pos, self.end_pos, allow_diagonal=False)
         self.current_path = self.pathfinder.get_path()
+        self._path_set = set(self.current_path)
+
+        # Skip start and end (they have their own colors)
+        self._path_cell_blits = [
+            (self._path_tile, self.grid_to_screen(x, y))
+            for x, y in self.current_path
+            if (x, y) != self.start_pos and (x, y) != self.end_pos
+        ]
+        half_tile = self.tile_size // 2
+        self._path_points = [
+            (x * self.tile_size + half_tile, y * self.tile_size + half_tile)
+            for x, y in self.current_path
+        ]
+        return found
+
+    def _block_cell(self, grid_x: int, grid_y: int, state: int) -> bool:
+        """
+        Set an empty cell to a blocking state unless that would cut off the path.
+        Runs at most one search for a successful placement, instead of a
+        would_block_path check followed by set_cell.
+        """
+        self.cells[grid_x * self.height + grid_y] = state
+        self._cells_changed()
+
+        if self._is_off_path(grid_x, grid_y):
+            return True
+
+        if not self._update_path():
+            # No route left, so undo the placement and restore the old path
+            self.cells[grid_x * self.height + grid_y] = EMPTY
+            self._update_path()
+            return False
+        return True
 
     def would_block_path(self, grid_x: int, grid_y: int) -> bool:
         """Check if placing a tower at position would block the path."""
-        return self.pathfinder.would_block_path(
-            self.cells,
-            (grid_x, grid_y),
-            self.start_pos,
-            self.end_pos,
-            allow_diagonal=False
-        )
+        if self._is_off_path(grid_x, grid_y):
+            return False
+
+        # Reuse the answer from an earlier search on the same cells
+        position = (grid_x, grid_y)
+        blocked = self._block_checks.get(position)
+        if blocked is None:
+            blocked = self.pathfinder.would_block_path(
+                self.cells,
+                position,
+                self.start_pos,
+                self.end_pos,
+                allow_diagonal=False
+            )
+            self._block_checks[position] = blocked
+        return blocked
+
+    def _is_off_path(self, grid_x: int, grid_y: int) -> bool:
+        """
+        Check if a cell is off the current path. Blocking such a cell can't cut
+        the route and leaves the current path shortest.
+        """
+        return bool(self.current_path) and (grid_x, grid_y) not in self._path_set
+
+    def _cells_changed(self):
+        """Invalidate everything derived from the cell states."""
+        self._bg_dirty = True
+        self._hover_validity = None
+        self._block_checks.clear()
 
     def get_path(self) -> list:
         """Get the current path from start to end."""
@@ -12,7 +12,8 @@ from config import (
 from grid import Grid
 from game_state import GameState
 from tower import TowerType, Tower
-from enemy import EnemySpawner
+from enemy import EnemySpawner, draw_enemies
+from utils import make_surface
 
 
 class Game:
@@ -29,6 +30,10 @@ class Game:
         self.window_height = GRID_HEIGHT * TILE_SIZE + UI_PANEL_HEIGHT
 
         self.screen = pygame.display.set_mode((self.window_width, self.window_height))
+        # Grid area below the UI panel; a view into the screen, so it is created once
+        self.grid_surface = self.screen.subsurface(pygame.Rect(0, UI_PANEL_HEIGHT,
+                                                               self.window_width,
+                                                               GRID_HEIGHT * TILE_SIZE))
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 24)
         self.large_font = pygame.font.Font(None, 36)
@@ -57,25 +62,81 @@ class Game:
         # Debug/info display
         self.show_debug = True
         self.show_path = True  # Toggle path visualization
+
+        # Static overlays and text, rendered once
+        self._pause_overlay = make_surface((self.window_width, self.window_height), alpha=True)
+        self._pause_overlay.fill((0, 0, 0, 150))
+        center_x, center_y = self.window_width // 2, self.window_height // 2
+        pause_text = self.large_font.render("PAUSED", True, COLORS['text'])
+        resume_text = self.font.render("Press P to resume", True, COLORS['text'])
+        self._pause_texts = [
+            (pause_text, pause_text.get_rect(center=(center_x, center_y))),
+            (resume_text, resume_text.get_rect(center=(center_x, center_y + 40))),
+        ]
+
+        controls = [
+            "Controls:",
+            "SPACE - Start Wave | Left Click - Place | Right Click - Remove",
+            "0 - Wall ($10) | 1/2/3 - Towers | P - Pause | T - Ranges",
+            "V - Path | D - Debug | R - Reset | ESC - Quit"
+        ]
+        y_offset = self.window_height - len(controls) * 18 - 10
+        self._controls_texts = [
+            (self.small_font.render(line, True, COLORS['text']), (10, y_offset + i * 18))
+            for i, line in enumerate(controls)
+        ]
+
+        # Event type -> handler (mouse motion is coalesced in handle_events)
+        self._event_handlers = {
+            pygame.QUIT: self._handle_quit,
+            pygame.KEYDOWN: self._handle_keydown,
+            pygame.MOUSEBUTTONDOWN: self._handle_mouse_down,
+            pygame.MOUSEBUTTONUP: self._handle_mouse_up,
+        }
+
+        # Set by input; while the game is frozen (paused or over) frames are
+        # only redrawn after something the player did
+        self._needs_redraw = True
+
+        # UI panel backgrounds per selected tower type, and the last rendered stats
+        self._ui_panels = {}
+        self._stats_key = None
+        self._stats_texts = []
+
+        # Rendered debug lines, reused until what they show changes
+        self._debug_key = None
+        self._debug_texts = []
     
     def handle_events(self):
         """Process all pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            elif event.type == pygame.KEYDOWN:
-                self._handle_keydown(event)
-            
-            elif event.type == pygame.MOUSEMOTION:
-                self._handle_mouse_motion(event)
-            
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                self._handle_mouse_down(event)
-            
-            elif event.type == pygame.MOUSEBUTTONUP:
-                self._handle_mouse_up(event)
-    
+        # Motion events only update the hover cell, so a run of them collapses
+        # to the latest one. It is applied before any other event so clicks
+        # still see the position the mouse had when they happened.
+        events = pygame.event.get()
+        if events:
+            self._needs_redraw = True
+
+        pending_motion = None
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                pending_motion = event
+                continue
+
+            if pending_motion is not None:
+                self._handle_mouse_motion(pending_motion)
+                pending_motion = None
+
+            handler = self._event_handlers.get(event.type)
+            if handler is not None:
+                handler(event)
+
+        if pending_motion is not None:
+            self._handle_mouse_motion(pending_motion)
+
+    def _handle_quit(self, event):
+        """Handle window close."""
+        self.running = False
+
     def _handle_keydown(self, event):
         """Handle keyboard input."""
         if event.key == pygame.K_ESCAPE:
@@ -150,7 +211,7 @@ class Game:
     
     def _reset_grid(self):
         """Reset the grid to initial state."""
-        self.grid = Grid()
+        self.grid.reset()
         self.enemies.clear()
         self.enemy_spawner = EnemySpawner(self.grid.current_path)
         self.game_state.reset()
@@ -177,20 +238,25 @@ class Game:
         if new_enemy:
             self.enemies.append(new_enemy)
 
-        # Update enemies
-        for enemy in self.enemies[:]:
+        # Update enemies, compacting survivors to the front of the list in one pass
+        enemies = self.enemies
+        kept = 0
+        for enemy in enemies:
             enemy.update(dt=1.0)
 
             # Check if enemy reached end
             if enemy.has_reached_end():
                 self.game_state.lose_life()
-                self.enemies.remove(enemy)
                 continue
 
             # Remove dead enemies and award money
             if not enemy.is_alive():
                 self.game_state.add_kill()
-                self.enemies.remove(enemy)
+                continue
+
+            enemies[kept] = enemy
+            kept += 1
+        del enemies[kept:]
 
         # Update towers (targeting and shooting)
         self.grid.update_towers(self.enemies, dt=1.0)
@@ -206,10 +272,7 @@ class Game:
         # Clear screen
         self.screen.fill(COLORS['background'])
 
-        # Create surface for grid area (offset by UI panel height)
-        grid_surface = self.screen.subsurface(pygame.Rect(0, UI_PANEL_HEIGHT,
-                                                          self.window_width,
-                                                          GRID_HEIGHT * TILE_SIZE))
+        grid_surface = self.grid_surface
 
         # Draw grid with hover highlight and optional path visualization
         self.grid.draw(grid_surface, self.hover_pos,
@@ -218,8 +281,7 @@ class Game:
                       selected_tower_pos=self.selected_tower_pos)
 
         # Draw enemies
-        for enemy in self.enemies:
-            enemy.draw(grid_surface)
+        draw_enemies(grid_surface, self.enemies)
 
         # Draw UI panel at top
         self._draw_ui_panel()
@@ -238,9 +300,12 @@ class Game:
     
     def _draw_ui_panel(self):
         """Draw the top UI panel with money, lives, and tower selection."""
-        # Background panel
-        panel_rect = pygame.Rect(0, 0, self.window_width, UI_PANEL_HEIGHT)
-        pygame.draw.rect(self.screen, (40, 40, 50), panel_rect)
+        # Background and tower buttons only change with the selected tower type
+        panel = self._ui_panels.get(self.selected_tower_type)
+        if panel is None:
+            panel = self._render_ui_panel(self.selected_tower_type)
+            self._ui_panels[self.selected_tower_type] = panel
+        self.screen.blit(panel, (0, 0))
         pygame.draw.line(self.screen, (100, 100, 110),
                         (0, UI_PANEL_HEIGHT), (self.window_width, UI_PANEL_HEIGHT), 2)
 
@@ -248,27 +313,38 @@ class Game:
         stats_x = 15
         stats_y = 15
 
-        money_text = self.font.render(f"Money: ${self.game_state.money}", True, (100, 255, 100))
-        self.screen.blit(money_text, (stats_x, stats_y))
-
-        lives_text = self.font.render(f"Lives: {self.game_state.lives}", True, (255, 100, 100))
-        self.screen.blit(lives_text, (stats_x, stats_y + 25))
-
         # Wave info
         wave_text = f"Wave: {self.game_state.current_wave}"
         if self.game_state.wave_active:
             wave_text += f" ({len(self.enemies)} enemies)"
         else:
             wave_text += " (SPACE to start)"
-        wave_surface = self.small_font.render(wave_text, True, (200, 200, 100))
-        self.screen.blit(wave_surface, (stats_x, stats_y + 50))
+
+        # Only re-render the stats when they change
+        stats_key = (self.game_state.money, self.game_state.lives, wave_text)
+        if stats_key != self._stats_key:
+            self._stats_key = stats_key
+            money_text = self.font.render(f"Money: ${self.game_state.money}", True, (100, 255, 100))
+            lives_text = self.font.render(f"Lives: {self.game_state.lives}", True, (255, 100, 100))
+            wave_surface = self.small_font.render(wave_text, True, (200, 200, 100))
+            self._stats_texts = [
+                (money_text, (stats_x, stats_y)),
+                (lives_text, (stats_x, stats_y + 25)),
+                (wave_surface, (stats_x, stats_y + 50)),
+            ]
+        self.screen.blits(self._stats_texts, doreturn=False)
+
+    def _render_ui_panel(self, selected_tower_type: str) -> pygame.Surface:
+        """Render the panel background and tower buttons for a selected tower type."""
+        panel = make_surface((self.window_width, UI_PANEL_HEIGHT))
+        panel.fill((40, 40, 50))
 
         # Tower selection (center/right)
         tower_x = 250
         tower_y = 10
 
         label = self.small_font.render("Select Tower:", True, COLORS['text'])
-        self.screen.blit(label, (tower_x, tower_y))
+        panel.blit(label, (tower_x, tower_y))
 
         # Draw tower type buttons
         tower_types = Tower.get_available_types()
@@ -281,27 +357,29 @@ class Game:
             y = tower_y + 20
 
             # Button background
-            is_selected = (tower_info['type'] == self.selected_tower_type)
+            is_selected = (tower_info['type'] == selected_tower_type)
             border_color = (255, 255, 255) if is_selected else (100, 100, 110)
             border_width = 3 if is_selected else 1
 
             button_rect = pygame.Rect(x, y, button_width, button_height)
-            pygame.draw.rect(self.screen, tower_info['color'], button_rect)
-            pygame.draw.rect(self.screen, border_color, button_rect, border_width)
+            pygame.draw.rect(panel, tower_info['color'], button_rect)
+            pygame.draw.rect(panel, border_color, button_rect, border_width)
 
             # Tower name
             name_text = self.small_font.render(tower_info['name'], True, COLORS['text'])
             name_rect = name_text.get_rect(center=(x + button_width // 2, y + 15))
-            self.screen.blit(name_text, name_rect)
+            panel.blit(name_text, name_rect)
 
             # Cost
             cost_text = self.small_font.render(f"${tower_info['cost']}", True, (100, 255, 100))
             cost_rect = cost_text.get_rect(center=(x + button_width // 2, y + 32))
-            self.screen.blit(cost_text, cost_rect)
+            panel.blit(cost_text, cost_rect)
 
             # Hotkey
             hotkey_text = self.small_font.render(f"[{tower_info['hotkey']}]", True, (200, 200, 200))
-            self.screen.blit(hotkey_text, (x + 2, y + 2))
+            panel.blit(hotkey_text, (x + 2, y + 2))
+
+        return panel
 
     def _draw_debug_info(self):
         """Draw debug information."""
@@ -309,69 +387,72 @@ class Game:
             return
 
         grid_x, grid_y = self.hover_pos
-        if not (0 <= grid_x < GRID_WIDTH and 0 <= grid_y < GRID_HEIGHT):
+        if not self.grid.in_bounds(grid_x, grid_y):
             return
 
-        debug_y = UI_PANEL_HEIGHT + 10
         cell_state = self.grid.get_cell(grid_x, grid_y)
+        has_path = self.grid.pathfinder.has_path()
+        path_length = len(self.grid.current_path)
+        tower = self.grid.get_tower(*self.selected_tower_pos) if self.selected_tower_pos else None
+
+        # Only re-render the text when something it shows has changed
+        debug_key = (grid_x, grid_y, cell_state, has_path, path_length, tower)
+        if debug_key != self._debug_key:
+            self._debug_key = debug_key
+            self._debug_texts = self._render_debug_texts(grid_x, grid_y, cell_state,
+                                                         has_path, path_length, tower)
+        self.screen.blits(self._debug_texts, doreturn=False)
+
+    def _render_debug_texts(self, grid_x: int, grid_y: int, cell_state: int,
+                            has_path: bool, path_length: int, tower) -> list:
+        """Render the debug info lines as (surface, position) pairs."""
+        debug_y = UI_PANEL_HEIGHT + 10
         state_names = {0: 'Empty', 1: 'Tower', 2: 'Wall', 3: 'Start', 4: 'End'}
         state_name = state_names.get(cell_state, 'Unknown')
 
         debug_text = f"Grid: ({grid_x}, {grid_y}) | State: {state_name}"
-        text_surface = self.font.render(debug_text, True, COLORS['text'])
-        self.screen.blit(text_surface, (10, debug_y))
+        texts = [(self.font.render(debug_text, True, COLORS['text']), (10, debug_y))]
 
         # Show path status
-        path_status = f"Path: {'EXISTS' if self.grid.pathfinder.has_path() else 'BLOCKED'} | Length: {len(self.grid.current_path)}"
-        path_surface = self.font.render(path_status, True, COLORS['text'])
-        self.screen.blit(path_surface, (10, debug_y + 20))
+        path_status = f"Path: {'EXISTS' if has_path else 'BLOCKED'} | Length: {path_length}"
+        texts.append((self.font.render(path_status, True, COLORS['text']), (10, debug_y + 20)))
 
         # Show selected tower info
-        if self.selected_tower_pos:
-            tower = self.grid.get_tower(*self.selected_tower_pos)
-            if tower:
-                info = tower.get_info()
-                tower_text = f"Selected: {info['name']} | Dmg: {info['damage']} | Range: {info['range']}"
-                tower_surface = self.font.render(tower_text, True, COLORS['text'])
-                self.screen.blit(tower_surface, (10, debug_y + 40))
+        if tower:
+            info = tower.get_info()
+            tower_text = f"Selected: {info['name']} | Dmg: {info['damage']} | Range: {info['range']}"
+            texts.append((self.font.render(tower_text, True, COLORS['text']), (10, debug_y + 40)))
+
+        return texts
 
     def _draw_controls_info(self):
         """Draw control instructions."""
-        controls = [
-            "Controls:",
-            "SPACE - Start Wave | Left Click - Place | Right Click - Remove",
-            "0 - Wall ($10) | 1/2/3 - Towers | P - Pause | T - Ranges",
-            "V - Path | D - Debug | R - Reset | ESC - Quit"
-        ]
-
-        y_offset = self.window_height - len(controls) * 18 - 10
-        for i, line in enumerate(controls):
-            text_surface = self.small_font.render(line, True, COLORS['text'])
-            self.screen.blit(text_surface, (10, y_offset + i * 18))
+        self.screen.blits(self._controls_texts, doreturn=False)
     
     def _draw_pause_overlay(self):
         """Draw pause screen overlay."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.window_width, self.window_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Pause text
-        pause_text = self.large_font.render("PAUSED", True, COLORS['text'])
-        text_rect = pause_text.get_rect(center=(self.window_width // 2, self.window_height // 2))
-        self.screen.blit(pause_text, text_rect)
-        
-        # Instructions
-        resume_text = self.font.render("Press P to resume", True, COLORS['text'])
-        resume_rect = resume_text.get_rect(center=(self.window_width // 2, self.window_height // 2 + 40))
-        self.screen.blit(resume_text, resume_rect)
+        self.screen.blit(self._pause_overlay, (0, 0))
+
+        # Pause text and instructions
+        self.screen.blits(self._pause_texts, doreturn=False)
     
+    def _run_frame(self):
+        """Handle input, advance one tick and draw unless nothing can have changed."""
+        self.handle_events()
+
+        # Checked before updating, so the tick that ends the game still gets drawn
+        was_frozen = self.game_state.is_paused() or self.game_state.is_game_over()
+        self.update()
+
+        if self._needs_redraw or not was_frozen:
+            self.draw()
+            self._needs_redraw = False
+
     def run(self):
         """Main game loop."""
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
+            self._run_frame()
             self.clock.tick(FPS)
         
         pygame.quit()
@@ -4,36 +4,22 @@ Implements A* algorithm for dynamic pathfinding around obstacles.
 """
 
 import heapq
-from typing import List, Tuple, Optional, Set
-from utils import manhattan_distance, grid_neighbors
+from itertools import chain
+from typing import List, Tuple, Optional, Sequence, Union
 from config import EMPTY, TOWER, WALL, START, END
 
+# Grid state, either flat and column-major like Grid.cells (indexed as
+# cells[x * grid_height + y]) or nested sequences indexed as cells[x][y]
+GridCells = Union[bytes, bytearray, Sequence[Sequence[int]]]
 
-class PathNode:
-    """
-    Node used in A* pathfinding algorithm.
-    """
-
-    def __init__(self, position: Tuple[int, int], g_score: float, h_score: float, parent: Optional['PathNode'] = None):
-        self.position = position  # (x, y) grid coordinates
-        self.g_score = g_score    # Cost from start to this node
-        self.h_score = h_score    # Heuristic cost from this node to goal
-        self.f_score = g_score + h_score  # Total cost
-        self.parent = parent      # Parent node for path reconstruction
-
-    def __lt__(self, other):
-        """Comparison for priority queue (lower f_score = higher priority)."""
-        return self.f_score < other.f_score
+# Neighbor offsets as (dx, dy, move cost), in the order they are explored
+_CARDINAL_MOVES = ((0, -1, 1.0), (0, 1, 1.0), (-1, 0, 1.0), (1, 0, 1.0))
+_DIAGONAL_MOVES = _CARDINAL_MOVES + (
+    (-1, -1, 1.414), (-1, 1, 1.414), (1, -1, 1.414), (1, 1, 1.414)
+)
 
-    def __eq__(self, other):
-        """Equality comparison based on position."""
-        if not isinstance(other, PathNode):
-            return False
-        return self.position == other.position
-
-    def __hash__(self):
-        """Hash based on position for set operations."""
-        return hash(self.position)
+# Lookup table indexed by cell state: 1 where enemies can walk (towers and walls block)
+_WALKABLE = bytes(1 if state in (EMPTY, START, END) else 0 for state in range(256))
 
 
 class Pathfinder:
@@ -48,13 +34,27 @@ class Pathfinder:
         self.current_path = []  # Cached path as list of (x, y) positions
         self.path_exists = True  # Track if a valid path exists
 
-    def find_path(self, grid_cells: List[List[int]], start: Tuple[int, int], goal: Tuple[int, int],
+        # Heuristic values for the last goal searched, laid out like the flat grid
+        self._h_goal = None
+        self._h_table = []
+
+    def _flat_cells(self, grid_cells: GridCells) -> Union[bytes, bytearray]:
+        """Get grid state as a flat column-major buffer, flattening nested input."""
+        if isinstance(grid_cells, (bytes, bytearray)):
+            return grid_cells
+        return bytes(chain.from_iterable(grid_cells))
+
+    def find_path(self, grid_cells: GridCells, start: Tuple[int, int], goal: Tuple[int, int],
                   allow_diagonal: bool = False) -> Optional[List[Tuple[int, int]]]:
         """
         Find shortest path from start to goal using A* algorithm.
 
+        Search state lives in flat lists indexed like the grid buffer, and the
+        open set holds plain (f_score, -g_score, index) tuples, so among equal
+        f_scores the cell furthest along (closest to the goal) is expanded first.
+
         Args:
-            grid_cells: 2D list representing grid state
+            grid_cells: Grid state, flat or indexed as [x][y]
             start: Starting position (x, y)
             goal: Goal position (x, y)
             allow_diagonal: Whether to allow diagonal movement
@@ -62,122 +62,109 @@ class Pathfinder:
         Returns:
             List of (x, y) positions from start to goal, or None if no path exists
         """
-        # Priority queue for open set (nodes to explore)
-        open_set = []
-        heapq.heappush(open_set, PathNode(start, 0, manhattan_distance(start, goal)))
+        cells = self._flat_cells(grid_cells)
+        width, height = self.grid_width, self.grid_height
+        moves = _DIAGONAL_MOVES if allow_diagonal else _CARDINAL_MOVES
+
+        # Distances to goal, reused across searches with the same goal
+        h_table = self._heuristic_table(goal)
 
-        # Track visited nodes to avoid reprocessing
-        closed_set: Set[Tuple[int, int]] = set()
+        start_index = start[0] * height + start[1]
+        goal_index = goal[0] * height + goal[1]
 
-        # Track best g_score for each position
-        g_scores = {start: 0}
+        # Best g_score, parent index and processed flag for each cell
+        g_scores = [float('inf')] * (width * height)
+        parents = [-1] * (width * height)
+        closed = bytearray(width * height)
+
+        # Priority queue for open set (cells to explore)
+        g_scores[start_index] = 0
+        open_set = [(h_table[start_index], 0, start_index)]
 
         while open_set:
-            # Get node with lowest f_score
-            current = heapq.heappop(open_set)
+            # Get cell with lowest f_score
+            _, neg_g_score, index = heapq.heappop(open_set)
+            g_score = -neg_g_score
 
             # Check if we reached the goal
-            if current.position == goal:
-                return self._reconstruct_path(current)
+            if index == goal_index:
+                return self._reconstruct_path(parents, index)
 
             # Skip if already processed
-            if current.position in closed_set:
+            if closed[index]:
                 continue
-
-            closed_set.add(current.position)
+            closed[index] = 1
 
             # Explore neighbors
-            x, y = current.position
-            neighbors = grid_neighbors(x, y, self.grid_width, self.grid_height, allow_diagonal)
+            x, y = divmod(index, height)
+            for dx, dy, move_cost in moves:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
 
-            for neighbor_pos in neighbors:
-                # Skip if already processed
-                if neighbor_pos in closed_set:
+                neighbor = nx * height + ny
+                if closed[neighbor]:
                     continue
 
                 # Skip if blocked (unless it's the goal)
-                if not self._is_walkable(grid_cells, neighbor_pos) and neighbor_pos != goal:
+                if not _WALKABLE[cells[neighbor]] and neighbor != goal_index:
                     continue
 
-                # Calculate movement cost (diagonal = 1.414, straight = 1)
-                if allow_diagonal:
-                    dx = abs(neighbor_pos[0] - current.position[0])
-                    dy = abs(neighbor_pos[1] - current.position[1])
-                    move_cost = 1.414 if (dx + dy) == 2 else 1.0
-                else:
-                    move_cost = 1.0
-
-                # Calculate tentative g_score
-                tentative_g = current.g_score + move_cost
-
-                # Check if this path to neighbor is better than any previous one
-                if neighbor_pos not in g_scores or tentative_g < g_scores[neighbor_pos]:
-                    g_scores[neighbor_pos] = tentative_g
-                    h_score = manhattan_distance(neighbor_pos, goal)
-
-                    neighbor_node = PathNode(
-                        position=neighbor_pos,
-                        g_score=tentative_g,
-                        h_score=h_score,
-                        parent=current
-                    )
-
-                    heapq.heappush(open_set, neighbor_node)
+                # Keep this route to neighbor if it beats any previous one
+                tentative_g = g_score + move_cost
+                if tentative_g < g_scores[neighbor]:
+                    g_scores[neighbor] = tentative_g
+                    parents[neighbor] = index
+                    heapq.heappush(open_set, (tentative_g + h_table[neighbor], -tentative_g, neighbor))
 
         # No path found
         return None
 
-    def _is_walkable(self, grid_cells: List[List[int]], position: Tuple[int, int]) -> bool:
+    def _heuristic_table(self, goal: Tuple[int, int]) -> List[int]:
         """
-        Check if a position is walkable (not blocked by tower/wall).
-
-        Args:
-            grid_cells: 2D list representing grid state
-            position: Position to check (x, y)
-
-        Returns:
-            True if walkable, False if blocked
+        Get the Manhattan distance to goal for every cell, laid out like the
+        flat grid state. The table is rebuilt only when the goal changes.
         """
-        x, y = position
-
-        # Check bounds
-        if not (0 <= x < self.grid_width and 0 <= y < self.grid_height):
-            return False
-
-        cell_state = grid_cells[x][y]
-
-        # Empty cells, start, and end are walkable
-        # Towers and walls are not walkable
-        return cell_state in (EMPTY, START, END)
-
-    def _reconstruct_path(self, goal_node: PathNode) -> List[Tuple[int, int]]:
+        if goal != self._h_goal:
+            goal_x, goal_y = goal
+            self._h_table = [
+                abs(x - goal_x) + abs(y - goal_y)
+                for x in range(self.grid_width)
+                for y in range(self.grid_height)
+            ]
+            self._h_goal = goal
+        return self._h_table
+
+    def _reconstruct_path(self, parents: List[int], goal_index: int) -> List[Tuple[int, int]]:
         """
-        Reconstruct path from goal node by following parent links.
+        Reconstruct path by following parent indices back from the goal.
 
         Args:
-            goal_node: The goal node reached by A*
+            parents: Parent cell index for each cell (-1 for the start)
+            goal_index: Flat index of the goal cell
 
         Returns:
             List of positions from start to goal
         """
+        height = self.grid_height
         path = []
-        current = goal_node
+        index = goal_index
 
-        while current is not None:
-            path.append(current.position)
-            current = current.parent
+        while index != -1:
+            path.append(divmod(index, height))
+            index = parents[index]
 
         # Reverse to get path from start to goal
         path.reverse()
         return path
 
-    def update_path(self, grid_cells: List[List[int]], start: Tuple[int, int],
+    def update_path(self, grid_cells: GridCells, start: Tuple[int, int],
                     goal: Tuple[int, int], allow_diagonal: bool = False) -> bool:
         """
         Update the current cached path.
 
         Args:
-            grid_cells: 2D list representing grid state
+            grid_cells: Grid state, flat or indexed as [x][y]
             start: Starting position
             goal: Goal position
             allow_diagonal: Whether to allow diagonal movement
@@ -204,7 +191,7 @@ class Pathfinder:
         """Check if a valid path currently exists."""
         return self.path_exists
 
-    def would_block_path(self, grid_cells: List[List[int]], position: Tuple[int, int],
+    def would_block_path(self, grid_cells: GridCells, position: Tuple[int, int],
                          start: Tuple[int, int], goal: Tuple[int, int],
                          allow_diagonal: bool = False) -> bool:
         """
@@ -220,24 +207,21 @@ class Pathfinder:
         Returns:
             True if placement would block path, False if path would still exist
         """
-        # Make a temporary copy of the grid with the tower placed
-        temp_grid = [row[:] for row in grid_cells]
+        cells = self._flat_cells(grid_cells)
         x, y = position
+        index = x * self.grid_height + y
 
         # Don't allow placing on start/end
-        if temp_grid[x][y] in (START, END):
+        if cells[index] in (START, END):
             return True
 
-        # Temporarily place tower
-        original_state = temp_grid[x][y]
-        temp_grid[x][y] = TOWER
+        # Make a temporary copy of the grid with the tower placed
+        temp_grid = bytearray(cells)
+        temp_grid[index] = TOWER
 
         # Try to find path with tower placed
         path = self.find_path(temp_grid, start, goal, allow_diagonal)
 
-        # Restore original state
-        temp_grid[x][y] = original_state
-
         # Return True if path was blocked (None returned)
         return path is None
 
@@ -4,8 +4,35 @@ Handles projectile movement, collision detection, and effects.
 """
 
 import pygame
-import math
-from typing import Optional
+from math import hypot
+from typing import Optional, Tuple
+from utils import make_surface
+
+
+# Pre-rendered sprites keyed by (color, radius): solid cores and translucent glows
+_CORE_SPRITES = {}
+_GLOW_SPRITES = {}
+
+
+def _get_core_sprite(color: tuple, radius: int):
+    """Get the cached solid projectile core sprite."""
+    sprite = _CORE_SPRITES.get((color, radius))
+    if sprite is None:
+        sprite = make_surface((radius * 2, radius * 2), alpha=True)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        _CORE_SPRITES[(color, radius)] = sprite
+    return sprite
+
+
+def _get_glow_sprite(color: tuple, radius: int):
+    """Get the cached glow sprite drawn around a projectile core."""
+    sprite = _GLOW_SPRITES.get((color, radius))
+    if sprite is None:
+        glow_radius = radius + 2
+        sprite = make_surface((glow_radius * 2, glow_radius * 2), alpha=True)
+        pygame.draw.circle(sprite, (*color, 100), (glow_radius, glow_radius), glow_radius)
+        _GLOW_SPRITES[(color, radius)] = sprite
+    return sprite
 
 
 class Projectile:
@@ -13,8 +40,19 @@ class Projectile:
     Projectile fired by towers at enemies.
     """
 
+    __slots__ = (
+        'x', 'y', 'target_x', 'target_y',
+        'speed', '_speed_sq', 'vx', 'vy',
+        'damage', 'active', 'color', 'radius'
+    )
+
     def __init__(self, x: float, y: float, target_x: float, target_y: float,
                  speed: float, damage: int, color: tuple = (255, 255, 100)):
+        self.reset(x, y, target_x, target_y, speed, damage, color)
+
+    def reset(self, x: float, y: float, target_x: float, target_y: float,
+              speed: float, damage: int, color: tuple = (255, 255, 100)):
+        """(Re)initialize all state, so pooled projectiles can be fired again."""
         # Position
         self.x = x
         self.y = y
@@ -25,6 +63,7 @@ class Projectile:
 
         # Movement
         self.speed = speed
+        self._speed_sq = speed * speed  # Arrival threshold, squared
         self.calculate_velocity()
 
         # Combat
@@ -39,14 +78,16 @@ class Projectile:
         """Calculate velocity vector toward target."""
         dx = self.target_x - self.x
         dy = self.target_y - self.y
-        distance = math.sqrt(dx * dx + dy * dy)
+        distance = hypot(dx, dy)
 
         if distance > 0:
-            self.vx = (dx / distance) * self.speed
-            self.vy = (dy / distance) * self.speed
+            # Scale the direction by speed with one division
+            inv = self.speed / distance
+            self.vx = dx * inv
+            self.vy = dy * inv
         else:
-            self.vx = 0
-            self.vy = 0
+            self.vx = 0.0
+            self.vy = 0.0
 
     def update(self, dt: float = 1.0):
         """
@@ -62,13 +103,10 @@ class Projectile:
         self.x += self.vx * dt
         self.y += self.vy * dt
 
-        # Check if reached target (within small threshold)
-        dist_to_target = math.sqrt(
-            (self.target_x - self.x) ** 2 +
-            (self.target_y - self.y) ** 2
-        )
-
-        if dist_to_target < self.speed:
+        # Check if reached target (within small threshold), comparing squared distances
+        dx = self.target_x - self.x
+        dy = self.target_y - self.y
+        if dx * dx + dy * dy < self._speed_sq:
             self.active = False
 
     def draw(self, surface: pygame.Surface):
@@ -76,17 +114,16 @@ class Projectile:
         if not self.active:
             return
 
-        pygame.draw.circle(surface, self.color,
-                          (int(self.x), int(self.y)), self.radius)
+        surface.blits(self._sprite_blits(), doreturn=False)
 
-        # Draw glow effect
-        glow_radius = self.radius + 2
-        glow_color = (*self.color, 100)
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, glow_color,
-                          (glow_radius, glow_radius), glow_radius)
-        surface.blit(glow_surface,
-                    (int(self.x) - glow_radius, int(self.y) - glow_radius))
+    def _sprite_blits(self) -> tuple:
+        """Get the (sprite, position) pairs for the core and its glow effect."""
+        x, y, radius = int(self.x), int(self.y), self.radius
+        glow_radius = radius + 2
+        return (
+            (_get_core_sprite(self.color, radius), (x - radius, y - radius)),
+            (_get_glow_sprite(self.color, radius), (x - glow_radius, y - glow_radius)),
+        )
 
     def is_active(self) -> bool:
         """Check if projectile is still active."""
@@ -109,9 +146,11 @@ class Projectile:
         if not self.active or not enemy.is_alive():
             return False
 
-        # Simple circle collision
-        dist = math.sqrt((self.x - enemy.x) ** 2 + (self.y - enemy.y) ** 2)
-        return dist < (self.radius + enemy.radius)
+        # Simple circle collision, comparing squared distances
+        dx = self.x - enemy.x
+        dy = self.y - enemy.y
+        hit_radius = self.radius + enemy.radius
+        return dx * dx + dy * dy < hit_radius * hit_radius
 
 
 class ProjectileManager:
@@ -121,6 +160,7 @@ class ProjectileManager:
 
     def __init__(self):
         self.projectiles = []
+        self._free = []  # Spent projectiles kept for reuse
 
     def add_projectile(self, x: float, y: float, target_x: float, target_y: float,
                       speed: float, damage: int, color: tuple = (255, 255, 100)):
@@ -134,7 +174,11 @@ class ProjectileManager:
             damage: Damage dealt on hit
             color: Projectile color (RGB)
         """
-        projectile = Projectile(x, y, target_x, target_y, speed, damage, color)
+        if self._free:
+            projectile = self._free.pop()
+            projectile.reset(x, y, target_x, target_y, speed, damage, color)
+        else:
+            projectile = Projectile(x, y, target_x, target_y, speed, damage, color)
         self.projectiles.append(projectile)
 
     def update(self, enemies: list, dt: float = 1.0):
@@ -145,27 +189,82 @@ class ProjectileManager:
             enemies: List of enemy objects
             dt: Delta time multiplier
         """
-        for projectile in self.projectiles[:]:  # Copy list to allow removal
+        buckets, cell_size = self._bucket_enemies(enemies)
+
+        # Compact live projectiles to the front of the list in one pass
+        projectiles = self.projectiles
+        kept = 0
+        for projectile in projectiles:
             if not projectile.is_active():
-                self.projectiles.remove(projectile)
+                self._free.append(projectile)
                 continue
 
             projectile.update(dt)
 
-            # Check collision with enemies
-            for enemy in enemies:
-                if projectile.hits_enemy(enemy):
-                    enemy.take_damage(projectile.damage)
-                    projectile.deactivate()
-                    break
+            # Check collision with nearby enemies
+            enemy = self._first_hit(projectile, buckets, cell_size)
+            if enemy is not None:
+                enemy.take_damage(projectile.damage)
+                projectile.deactivate()
+
+            projectiles[kept] = projectile
+            kept += 1
+        del projectiles[kept:]
+
+    def _bucket_enemies(self, enemies: list) -> Tuple[dict, float]:
+        """
+        Group enemies by grid cell for the collision broad phase.
+
+        Cells are at least as wide as the largest hit distance, so any enemy a
+        projectile touches is in the projectile's cell or one of its neighbors.
+
+        Returns:
+            ({(cell_x, cell_y): [(enemy index, enemy), ...]}, cell size)
+        """
+        if not enemies:
+            return {}, 1
+
+        max_projectile_radius = max((p.radius for p in self.projectiles), default=0)
+        cell_size = max(max(enemy.radius for enemy in enemies) + max_projectile_radius, 1)
+
+        buckets = {}
+        for index, enemy in enumerate(enemies):
+            cell = (int(enemy.x // cell_size), int(enemy.y // cell_size))
+            buckets.setdefault(cell, []).append((index, enemy))
+        return buckets, cell_size
+
+    def _first_hit(self, projectile: Projectile, buckets: dict, cell_size: float):
+        """Find the earliest enemy in the original list order that the projectile hits."""
+        cell_x = int(projectile.x // cell_size)
+        cell_y = int(projectile.y // cell_size)
+
+        best_index = None
+        best_enemy = None
+        for x in (cell_x - 1, cell_x, cell_x + 1):
+            for y in (cell_y - 1, cell_y, cell_y + 1):
+                # Buckets are in ascending index order, so stop at the first hit
+                # or once past the best hit found so far
+                for index, enemy in buckets.get((x, y), ()):
+                    if best_index is not None and index > best_index:
+                        break
+                    if projectile.hits_enemy(enemy):
+                        best_index, best_enemy = index, enemy
+                        break
+        return best_enemy
 
     def draw(self, surface: pygame.Surface):
-        """Draw all active projectiles."""
+        """Draw all active projectiles in a single batch of sprite blits."""
+        blits = []
         for projectile in self.projectiles:
-            projectile.draw(surface)
+            if projectile.active:
+                blits.extend(projectile._sprite_blits())
+        surface.blits(blits, doreturn=False)
 
     def clear(self):
         """Remove all projectiles."""
+        for projectile in self.projectiles:
+            projectile.deactivate()
+        self._free.extend(self.projectiles)
         self.projectiles.clear()
 
     def get_count(self) -> int:
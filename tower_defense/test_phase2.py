@@ -16,6 +16,8 @@ def print_grid(grid, path=None, start=None, end=None, title="Grid"):
     print("S = Start, E = End, # = Tower, * = Path, . = Empty")
     print()
 
+    path_cells = set(path) if path else ()
+
     for y in range(height):
         for x in range(width):
             if (x, y) == start:
@@ -24,7 +26,7 @@ def print_grid(grid, path=None, start=None, end=None, title="Grid"):
                 print("E", end=" ")
             elif grid[x][y] == TOWER:
                 print("#", end=" ")
-            elif path and (x, y) in path:
+            elif (x, y) in path_cells:
                 print("*", end=" ")
             else:
                 print(".", end=" ")
@@ -234,6 +236,37 @@ def test_edge_cases():
     print("[PASS] Handled adjacent positions")
 
 
+def test_closing_only_gap_blocks():
+    """Test 8: Closing the only gap in a wall blocks the path."""
+    print("=" * 60)
+    print("TEST 8: Closing the Only Gap")
+    print("=" * 60)
+
+    width, height = 10, 7
+    grid = [[EMPTY for _ in range(height)] for _ in range(width)]
+    start = (1, 3)
+    end = (8, 3)
+
+    pathfinder = Pathfinder(width, height)
+
+    # Open grid, so a tower anywhere leaves a route
+    assert pathfinder.would_block_path(grid, (5, 1), start, end) == False, \
+        "Placing on an open grid should not block!"
+    print("[PASS] Placement on an open grid does not block")
+
+    # Wall off column 5 except the top cell
+    for y in range(1, height):
+        grid[5][y] = TOWER
+
+    path = pathfinder.find_path(grid, start, end)
+    print_grid(grid, path, start, end, "Wall with a single gap at (5, 0)")
+    would_block = pathfinder.would_block_path(grid, (5, 0), start, end)
+    print(f"Would block (5, 0): {would_block}")
+
+    assert would_block == True, "Closing the only gap should block!"
+    print("[PASS] Closing the only gap blocks the path")
+
+
 def run_all_tests():
     """Run all pathfinding tests."""
     print("\n" + "=" * 60)
@@ -247,7 +280,8 @@ def run_all_tests():
         test_blocked_path,
         test_would_block_validation,
         test_path_update_on_change,
-        test_edge_cases
+        test_edge_cases,
+        test_closing_only_gap_blocks
     ]
 
     passed = 0
@@ -5,7 +5,9 @@ Tests tower placement, economy, and basic functionality without GUI.
 
 from tower import Tower, TowerType, create_tower
 from game_state import GameState
-from config import STARTING_MONEY, STARTING_LIVES
+from grid import Grid
+from enemy import EnemyType, create_enemy
+from config import STARTING_MONEY, STARTING_LIVES, EMPTY, WALL
 
 
 def test_tower_creation():
@@ -205,6 +207,82 @@ def test_refund_system():
     print("\n[PASS] Refund system working correctly")
 
 
+def test_blocked_placement_rolls_back():
+    """Test 7: Placing a tower that would cut off the path is undone."""
+    print("\n" + "=" * 60)
+    print("TEST 7: Blocked Placement Rollback")
+    print("=" * 60)
+
+    grid = Grid()
+    game_state = GameState()
+
+    # Wall off a full column between start and end, leaving one gap
+    gap_x, gap_y = 20, 15
+    for y in range(grid.height):
+        if y != gap_y:
+            grid.set_cell(gap_x, y, WALL)
+
+    path_before = list(grid.current_path)
+    money_before = game_state.money
+    assert (gap_x, gap_y) in path_before, "Path should go through the gap"
+    print(f"\nPath length through gap: {len(path_before)}")
+
+    assert not grid.is_valid_placement(gap_x, gap_y), "Gap placement should be reported invalid"
+    placed = grid.place_tower(gap_x, gap_y, TowerType.BASIC, game_state)
+    print(f"Placement in gap succeeded: {placed}")
+
+    assert not placed, "Placement cutting the only route should fail"
+    assert grid.get_cell(gap_x, gap_y) == EMPTY, "Gap cell should be rolled back to EMPTY"
+    assert grid.current_path == path_before, "Path should be unchanged after rollback"
+    assert grid.get_tower(gap_x, gap_y) is None, "No tower should be added"
+    assert game_state.money == money_before, "Money should not be spent"
+
+    # A placement elsewhere still works afterwards
+    assert grid.place_tower(gap_x + 2, gap_y, TowerType.BASIC, game_state), "Open cell should accept a tower"
+    assert grid.current_path and (gap_x, gap_y) in grid.current_path, "Path should still use the gap"
+
+    print("\n[PASS] Blocked placement rolled back")
+
+
+def test_tower_coverage_targeting():
+    """Test 8: Grid coverage index drives tower targeting."""
+    print("\n" + "=" * 60)
+    print("TEST 8: Tower Coverage and Targeting")
+    print("=" * 60)
+
+    grid = Grid()
+    game_state = GameState()
+
+    # Enemy two tiles away is in range (40px of 100px); one 20 tiles away is not
+    assert grid.place_tower(10, 10, TowerType.BASIC, game_state), "Tower should be placed"
+    tower = grid.get_tower(10, 10)
+    near = create_enemy([(12, 10)], EnemyType.BASIC, wave_number=1)
+    far = create_enemy([(30, 10)], EnemyType.BASIC, wave_number=1)
+
+    grid.update_towers([far, near])
+    print(f"\nTarget after update: {tower.target.name if tower.target else None}")
+    assert tower.target is near, "Tower should target the enemy in range"
+    assert grid._tower_coverage, "Placed tower should cover cells"
+
+    # Removing the tower drops it from every covered cell
+    grid.remove_tower(10, 10, game_state)
+    assert all(tower not in covering for covering in grid._tower_coverage.values()), \
+        "Removed tower should not be in the coverage index"
+    assert not grid._tower_coverage, "No coverage should remain without towers"
+
+    # Coverage is rebuilt for towers placed after a reset
+    assert grid.place_tower(5, 5, TowerType.SLOW, game_state), "Tower should be placed"
+    grid.reset()
+    assert not grid._tower_coverage, "Reset should clear the coverage index"
+    assert grid.place_tower(10, 10, TowerType.BASIC, game_state), "Tower should be placed after reset"
+    tower = grid.get_tower(10, 10)
+    near = create_enemy([(12, 10)], EnemyType.BASIC, wave_number=1)
+    grid.update_towers([near])
+    assert tower.target is near, "Tower placed after reset should target the enemy in range"
+
+    print("\n[PASS] Coverage index keeps targeting correct")
+
+
 def run_all_tests():
     """Run all Phase 3 tests."""
     print("\n" + "=" * 60)
@@ -217,7 +295,9 @@ def run_all_tests():
         test_tower_costs,
         test_tower_types,
         test_tower_info,
-        test_refund_system
+        test_refund_system,
+        test_blocked_placement_rolls_back,
+        test_tower_coverage_targeting
     ]
 
     passed = 0
@@ -3,6 +3,10 @@ Test script for Phase 4: Enemy Mechanics
 Tests enemy creation, movement, and wave system without GUI.
 """
 
+import os
+
+import pygame
+
 from enemy import Enemy, EnemyType, EnemySpawner, create_enemy
 from config import BASE_ENEMY_HEALTH, BASE_ENEMY_SPEED
 
@@ -154,6 +158,7 @@ def test_enemy_spawning():
         if enemy:
             spawned_count += 1
             assert enemy.is_alive(), "Spawned enemy should be alive"
+            assert enemy.world_path is spawner.world_path, "Enemies should share the spawner's world path"
 
     print(f"Enemies spawned: {spawned_count}")
     assert spawned_count == initial_count, f"Should spawn all {initial_count} enemies"
@@ -222,6 +227,46 @@ def test_wave_scaling():
     print("\n[PASS] Wave scaling working")
 
 
+def test_game_over_frame_drawn():
+    """Test 8: The tick that ends the game is still drawn."""
+    print("\n" + "=" * 60)
+    print("TEST 8: Game Over Frame Is Drawn")
+    print("=" * 60)
+
+    # Run headless, and leave no display or environment change behind
+    previous_driver = os.environ.get("SDL_VIDEODRIVER")
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    try:
+        from main import Game
+
+        game = Game()
+        game.game_state.lives = 1
+        game.enemies.append(create_enemy([(0, 0)], EnemyType.BASIC, wave_number=1))
+
+        # No pending input, so only the game state can trigger a redraw
+        pygame.event.clear()
+        game._needs_redraw = False
+        draws = []
+        game.draw = lambda: draws.append(game.game_state.lives)
+
+        game._run_frame()
+        print(f"\nGame over: {game.game_state.is_game_over()}, frames drawn: {len(draws)}")
+        assert game.game_state.is_game_over(), "Enemy reaching the end should end the game"
+        assert draws == [0], "The frame that ended the game should be drawn"
+
+        # Once frozen with no input, frames are skipped
+        game._run_frame()
+        assert len(draws) == 1, "Frozen frames without input should not redraw"
+    finally:
+        pygame.quit()
+        if previous_driver is None:
+            del os.environ["SDL_VIDEODRIVER"]
+        else:
+            os.environ["SDL_VIDEODRIVER"] = previous_driver
+
+    print("\n[PASS] Game over frame drawn")
+
+
 def run_all_tests():
     """Run all Phase 4 tests."""
     print("\n" + "=" * 60)
@@ -235,7 +280,8 @@ def run_all_tests():
         test_wave_generation,
         test_enemy_spawning,
         test_enemy_movement,
-        test_wave_scaling
+        test_wave_scaling,
+        test_game_over_frame_drawn
     ]
 
     passed = 0
@@ -9,8 +9,9 @@ try:
 except ImportError:
     PYGAME_AVAILABLE = False
 
-from typing import Optional, Tuple
-from utils import distance
+from math import hypot
+from typing import Dict, Optional, Tuple
+from utils import make_surface
 
 
 class TowerType:
@@ -21,11 +22,73 @@ class TowerType:
     SNIPER = "sniper"
 
 
+# Base stats by type: (range in pixels, damage, ticks between shots, projectile speed,
+# cost, color, name, description)
+_TOWER_STATS: Dict[str, Tuple[int, int, int, int, int, Tuple[int, int, int], str, str]] = {
+    TowerType.WALL: (0, 0, 0, 0, 10, (80, 80, 90), "Wall",
+                     "Cheap obstacle to guide enemies"),  # Dark gray, no range - just blocks
+    TowerType.BASIC: (100, 10, 60, 5, 100, (100, 100, 180), "Basic Tower",
+                      "Balanced damage and range"),  # Blue
+    TowerType.SLOW: (120, 5, 45, 6, 150, (80, 180, 180), "Slow Tower",
+                     "Slows enemies, wide range"),  # Cyan
+    TowerType.SNIPER: (200, 50, 180, 15, 250, (180, 100, 100), "Sniper Tower",
+                       "High damage, long range, slow fire"),  # Red
+}
+
+# Slow tower effect: (speed multiplier, duration in ticks) - 50% speed for 2 seconds
+_SLOW_EFFECT = (0.5, 120)
+
+# Cost of each tower type, for placement checks without instantiating
+_TOWER_COSTS = {tower_type: stats[4] for tower_type, stats in _TOWER_STATS.items()}
+
+# Pre-rendered range indicators, keyed by (range, color, alpha)
+_RANGE_SPRITES = {}
+
+
+def _get_range_sprite(radius: int, color: Tuple[int, int, int], alpha: int):
+    """Get the cached translucent range circle (fill plus border) for a tower."""
+    key = (radius, color, alpha)
+    sprite = _RANGE_SPRITES.get(key)
+    if sprite is None:
+        sprite = make_surface((radius * 2, radius * 2), alpha=True)
+        pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+        pygame.draw.circle(sprite, (*color, 150), (radius, radius), radius, 2)
+        _RANGE_SPRITES[key] = sprite
+    return sprite
+
+
+# Tower type listing for the UI, built once. Name, cost and color come from
+# the stats table; only the short description and hotkey are UI-specific.
+_AVAILABLE_TYPES = tuple(
+    {
+        'type': tower_type,
+        'name': _TOWER_STATS[tower_type][6],
+        'cost': _TOWER_STATS[tower_type][4],
+        'color': _TOWER_STATS[tower_type][5],
+        'description': description,
+        'hotkey': hotkey
+    }
+    for tower_type, description, hotkey in (
+        (TowerType.WALL, 'Cheap obstacle', '0'),
+        (TowerType.BASIC, 'Balanced damage and range', '1'),
+        (TowerType.SLOW, 'Slows enemies, wide range', '2'),
+        (TowerType.SNIPER, 'High damage, long range', '3'),
+    )
+)
+
+
 class Tower:
     """
     Base tower class with shooting, targeting, and upgrade capabilities.
     """
 
+    __slots__ = (
+        'grid_x', 'grid_y', 'world_x', 'world_y', 'tower_type',
+        'range', 'damage', 'fire_rate', 'projectile_speed', 'cost', 'color', 'name', 'description',
+        'range_sq', 'slow_effect', 'slow_duration',
+        'target', 'shoot_cooldown', 'projectiles', '_info'
+    )
+
     def __init__(self, grid_x: int, grid_y: int, tower_type: str):
         # Position
         self.grid_x = grid_x
@@ -42,67 +105,21 @@ class Tower:
         self.shoot_cooldown = 0  # Ticks until can shoot again
         self.projectiles = []  # List of active projectiles
 
-        # Visual
-        self.angle = 0  # Rotation angle for barrel
+        self._info = None  # get_info() result, built on first request
 
     def _initialize_stats(self):
-        """Initialize tower stats based on type."""
-        if self.tower_type == TowerType.WALL:
-            self.range = 0  # No range - just blocks
-            self.damage = 0
-            self.fire_rate = 0
-            self.projectile_speed = 0
-            self.cost = 10
-            self.color = (80, 80, 90)  # Dark gray
-            self.name = "Wall"
-            self.description = "Cheap obstacle to guide enemies"
-
-        elif self.tower_type == TowerType.BASIC:
-            self.range = 100  # pixels
-            self.damage = 10
-            self.fire_rate = 60  # ticks between shots (1 second at 60 FPS)
-            self.projectile_speed = 5
-            self.cost = 100
-            self.color = (100, 100, 180)  # Blue
-            self.name = "Basic Tower"
-            self.description = "Balanced damage and range"
-
-        elif self.tower_type == TowerType.SLOW:
-            self.range = 120  # Wider range
-            self.damage = 5  # Lower damage
-            self.fire_rate = 45  # Faster fire rate
-            self.projectile_speed = 6
-            self.slow_effect = 0.5  # Slows enemies to 50% speed
-            self.slow_duration = 120  # 2 seconds at 60 FPS
-            self.cost = 150
-            self.color = (80, 180, 180)  # Cyan
-            self.name = "Slow Tower"
-            self.description = "Slows enemies, wide range"
-
-        elif self.tower_type == TowerType.SNIPER:
-            self.range = 200  # Very long range
-            self.damage = 50  # High damage
-            self.fire_rate = 180  # Slow fire rate (3 seconds)
-            self.projectile_speed = 15  # Fast projectiles
-            self.cost = 250
-            self.color = (180, 100, 100)  # Red
-            self.name = "Sniper Tower"
-            self.description = "High damage, long range, slow fire"
-
+        """Initialize tower stats based on type (unknown types fall back to basic)."""
+        stats = _TOWER_STATS.get(self.tower_type, _TOWER_STATS[TowerType.BASIC])
+        (self.range, self.damage, self.fire_rate, self.projectile_speed,
+         self.cost, self.color, self.name, self.description) = stats
+
+        # Only slow towers slow their targets; a zero duration disables the effect
+        if self.tower_type == TowerType.SLOW:
+            self.slow_effect, self.slow_duration = _SLOW_EFFECT
         else:
-            # Default to basic
-            self._initialize_stats_for_basic()
-
-    def _initialize_stats_for_basic(self):
-        """Fallback to basic tower stats."""
-        self.range = 100
-        self.damage = 10
-        self.fire_rate = 60
-        self.projectile_speed = 5
-        self.cost = 100
-        self.color = (100, 100, 180)
-        self.name = "Basic Tower"
-        self.description = "Balanced damage and range"
+            self.slow_effect, self.slow_duration = 1.0, 0
+
+        self.range_sq = self.range * self.range  # For sqrt-free range checks
 
     def set_world_position(self, world_x: int, world_y: int):
         """Set the world position (screen coordinates) of the tower center."""
@@ -145,36 +162,37 @@ class Tower:
         if not self.target:
             self.target = self._find_closest_enemy(enemies)
 
-        # Update barrel rotation to face target
-        if self.target:
-            dx = self.target.x - self.world_x
-            dy = self.target.y - self.world_y
-            import math
-            self.angle = math.atan2(dy, dx)
-
     def _find_closest_enemy(self, enemies: list):
         """Find the closest enemy within range."""
         closest = None
-        closest_dist = float('inf')
+        closest_dist = self.range_sq  # Doubles as the range check
 
         for enemy in enemies:
             if not enemy.is_alive():
                 continue
 
-            dist = self._distance_to(enemy)
-            if dist <= self.range and dist < closest_dist:
+            # Strictly closer wins so ties keep the earlier enemy, but an enemy
+            # exactly on the range edge still counts when nothing else does
+            dist_sq = self._distance_sq_to(enemy)
+            if dist_sq < closest_dist or (dist_sq == closest_dist and closest is None):
                 closest = enemy
-                closest_dist = dist
+                closest_dist = dist_sq
 
         return closest
 
     def _is_in_range(self, enemy) -> bool:
         """Check if an enemy is within range."""
-        return self._distance_to(enemy) <= self.range
+        return self._distance_sq_to(enemy) <= self.range_sq
 
     def _distance_to(self, enemy) -> float:
         """Calculate distance to an enemy."""
-        return distance((self.world_x, self.world_y), (enemy.x, enemy.y))
+        return hypot(enemy.x - self.world_x, enemy.y - self.world_y)
+
+    def _distance_sq_to(self, enemy) -> float:
+        """Calculate squared distance to an enemy."""
+        dx = enemy.x - self.world_x
+        dy = enemy.y - self.world_y
+        return dx * dx + dy * dy
 
     def _shoot(self):
         """Fire a projectile at the current target."""
@@ -189,7 +207,7 @@ class Tower:
         self.target.take_damage(self.damage)
 
         # Apply slow effect if this is a slow tower
-        if self.tower_type == TowerType.SLOW and hasattr(self, 'slow_effect'):
+        if self.slow_duration:
             self.target.apply_slow(self.slow_effect, self.slow_duration)
 
     def draw(self, surface, tile_size: int):
@@ -212,10 +230,15 @@ class Tower:
 
         # Draw barrel (line pointing at target)
         if self.target:
-            import math
             barrel_length = tile_size // 2
-            end_x = self.world_x + int(barrel_length * math.cos(self.angle))
-            end_y = self.world_y + int(barrel_length * math.sin(self.angle))
+            dx = self.target.x - self.world_x
+            dy = self.target.y - self.world_y
+            dist = hypot(dx, dy)
+            if dist > 0:
+                end_x = self.world_x + int(barrel_length * (dx / dist))
+                end_y = self.world_y + int(barrel_length * (dy / dist))
+            else:
+                end_x, end_y = self.world_x + barrel_length, self.world_y
             pygame.draw.line(surface, (255, 255, 255),
                            (self.world_x, self.world_y),
                            (end_x, end_y), 3)
@@ -231,33 +254,25 @@ class Tower:
         if not PYGAME_AVAILABLE:
             return
 
-        # Create transparent surface for range circle
-        range_surface = pygame.Surface((self.range * 2, self.range * 2), pygame.SRCALPHA)
-
-        # Draw range circle
-        pygame.draw.circle(range_surface, (*self.color, alpha),
-                          (self.range, self.range), self.range)
-
-        # Draw range border
-        pygame.draw.circle(range_surface, (*self.color, 150),
-                          (self.range, self.range), self.range, 2)
-
-        # Blit to main surface (centered on tower)
-        surface.blit(range_surface,
+        # Blit the cached range circle centered on the tower
+        surface.blit(_get_range_sprite(self.range, self.color, alpha),
                     (self.world_x - self.range, self.world_y - self.range))
 
     def get_info(self) -> dict:
-        """Get tower information for UI display."""
-        return {
-            'name': self.name,
-            'type': self.tower_type,
-            'damage': self.damage,
-            'range': self.range,
-            'fire_rate': self.fire_rate,
-            'cost': self.cost,
-            'description': self.description,
-            'position': (self.grid_x, self.grid_y)
-        }
+        """Get tower information for UI display (shared; do not modify)."""
+        # Stats and position are fixed once the tower exists, so build this once
+        if self._info is None:
+            self._info = {
+                'name': self.name,
+                'type': self.tower_type,
+                'damage': self.damage,
+                'range': self.range,
+                'fire_rate': self.fire_rate,
+                'cost': self.cost,
+                'description': self.description,
+                'position': (self.grid_x, self.grid_y)
+            }
+        return self._info
 
     def get_cost(self) -> int:
         """Get the cost of this tower."""
@@ -266,51 +281,12 @@ class Tower:
     @staticmethod
     def get_tower_cost(tower_type: str) -> int:
         """Get the cost of a tower type without instantiating."""
-        costs = {
-            TowerType.WALL: 10,
-            TowerType.BASIC: 100,
-            TowerType.SLOW: 150,
-            TowerType.SNIPER: 250
-        }
-        return costs.get(tower_type, 100)
+        return _TOWER_COSTS.get(tower_type, 100)
 
     @staticmethod
-    def get_available_types() -> list:
-        """Get list of all available tower types."""
-        return [
-            {
-                'type': TowerType.WALL,
-                'name': 'Wall',
-                'cost': 10,
-                'color': (80, 80, 90),
-                'description': 'Cheap obstacle',
-                'hotkey': '0'
-            },
-            {
-                'type': TowerType.BASIC,
-                'name': 'Basic Tower',
-                'cost': 100,
-                'color': (100, 100, 180),
-                'description': 'Balanced damage and range',
-                'hotkey': '1'
-            },
-            {
-                'type': TowerType.SLOW,
-                'name': 'Slow Tower',
-                'cost': 150,
-                'color': (80, 180, 180),
-                'description': 'Slows enemies, wide range',
-                'hotkey': '2'
-            },
-            {
-                'type': TowerType.SNIPER,
-                'name': 'Sniper Tower',
-                'cost': 250,
-                'color': (180, 100, 100),
-                'description': 'High damage, long range',
-                'hotkey': '3'
-            }
-        ]
+    def get_available_types() -> tuple:
+        """Get all available tower types (shared; do not modify)."""
+        return _AVAILABLE_TYPES
 
 
 def create_tower(grid_x: int, grid_y: int, tower_type: str) -> Tower:
@@ -5,12 +5,16 @@ Helper functions used across multiple modules.
 
 import math
 
+try:
+    import pygame
+    PYGAME_AVAILABLE = True
+except ImportError:
+    PYGAME_AVAILABLE = False
+
 
 def distance(pos1: tuple, pos2: tuple) -> float:
     """Calculate Euclidean distance between two points."""
-    dx = pos2[0] - pos1[0]
-    dy = pos2[1] - pos1[1]
-    return math.sqrt(dx * dx + dy * dy)
+    return math.hypot(pos2[0] - pos1[0], pos2[1] - pos1[1])
 
 
 def manhattan_distance(pos1: tuple, pos2: tuple) -> int:
@@ -18,6 +22,33 @@ def manhattan_distance(pos1: tuple, pos2: tuple) -> int:
     return abs(pos2[0] - pos1[0]) + abs(pos2[1] - pos1[1])
 
 
+def make_surface(size: tuple, alpha: bool = False):
+    """
+    Create a pygame surface for long-lived use (caches, sprites, overlays).
+
+    Once a display exists the surface is converted to its pixel format, so
+    later blits are straight copies instead of per-pixel conversions.
+
+    Args:
+        size: (width, height) in pixels
+        alpha: Whether the surface needs per-pixel alpha
+
+    Returns:
+        New surface, transparent if alpha is set
+    """
+    if not PYGAME_AVAILABLE:
+        raise RuntimeError("make_surface requires pygame, which is not installed")
+
+    if alpha:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+    else:
+        surface = pygame.Surface(size)
+
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha() if alpha else surface.convert()
+    return surface
+
+
 def lerp(a: float, b: float, t: float) -> float:
     """Linear interpolation between a and b by factor t."""
     return a + (b - a) * t
@@ -28,6 +59,11 @@ def clamp(value: float, min_val: float, max_val: float) -> float:
     return max(min_val, min(max_val, value))
 
 
+# Neighbor offsets: cardinal directions, then diagonals
+_CARDINAL_DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+_DIAGONAL_DIRECTIONS = _CARDINAL_DIRECTIONS + ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
 def grid_neighbors(x: int, y: int, width: int, height: int, diagonal: bool = False) -> list:
     """
     Get valid neighboring grid positions.
@@ -40,21 +76,9 @@ def grid_neighbors(x: int, y: int, width: int, height: int, diagonal: bool = Fal
     Returns:
         List of valid (x, y) neighbor positions
     """
-    neighbors = []
-    
-    # Cardinal directions
-    directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-    
-    # Add diagonal directions if requested
-    if diagonal:
-        directions += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-    
-    for dx, dy in directions:
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < width and 0 <= ny < height:
-            neighbors.append((nx, ny))
-    
-    return neighbors
+    directions = _DIAGONAL_DIRECTIONS if diagonal else _CARDINAL_DIRECTIONS
+    return [(x + dx, y + dy) for dx, dy in directions
+            if 0 <= x + dx < width and 0 <= y + dy < height]
 
 
 def format_time(seconds: float) -> str: